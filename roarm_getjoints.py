@@ -1,15 +1,67 @@
 import requests
 import argparse
-import json
+import re
+import time
 from enum import Enum, auto
 from typing import Optional
 
+# orjson parses straight from the response bytes and is much faster than the
+# stdlib parser. Both raise a ValueError subclass on bad input.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# cysimdjson, when installed, is used through one reusable parser so its
+# internal buffers are allocated once rather than per response
+try:
+    import cysimdjson
+    _PARSER = cysimdjson.JSONParser()
+except ImportError:
+    _PARSER = None
+
+
+# Keys read from a T:105 feedback response
+T105_KEYS = ('b', 's', 'e', 't', 'r', 'g', 'x', 'y', 'z', 'tit')
+
+# Matches one "key":number pair for any of T105_KEYS, in any order
+_T105_FIELD = re.compile(rb'"(b|s|e|t|r|g|x|y|z|tit)"\s*:\s*(-?[0-9][0-9.eE+-]*)')
+
+
+# Last raw T:105 response and its parsed fields. Recording twice without
+# moving the arm returns identical bytes, so there's no need to re-parse.
+_LAST = {"raw": None, "parsed": None}
+
+
+def parse_t105_fields(raw: bytes) -> dict:
+    """
+    Pull the joint/coordinate fields out of a T:105 response.
+    The schema is flat and fixed, so a single regex scan is enough; only
+    fall back to a full JSON parse if some field wasn't matched.
+    Values are numbers on every path.
+    """
+    if raw == _LAST["raw"]:
+        return _LAST["parsed"]
+
+    fields = {key.decode(): float(value) for key, value in _T105_FIELD.findall(raw)}
+    if len(fields) != len(T105_KEYS):
+        if _PARSER is not None:
+            doc = _PARSER.parse(raw)
+            fields = {key: doc[key] for key in T105_KEYS if key in doc}
+        else:
+            fields = json_loads(raw)
+
+    _LAST["raw"] = raw
+    _LAST["parsed"] = fields
+    return fields
+
 
 class StateResult(Enum):
     """Return values for state execution"""
     SUCCESS = auto()
     FAILURE = auto()
     QUIT = auto()
+    BULK = auto()
 
 
 class RecorderState:
@@ -35,6 +87,7 @@ class MenuState(RecorderState):
         print("="*60)
         print("\n  Options:")
         print("    [ENTER] - Record current position (T:105)")
+        print("    [b] - Bulk record a demonstration (stream T:105)")
         print("    [q] - Quit")
         print("\n" + "="*60)
         
@@ -42,10 +95,12 @@ class MenuState(RecorderState):
         
         if choice == 'q':
             return StateResult.QUIT
+        elif choice == 'b':
+            return StateResult.BULK
         elif choice == '':
             return StateResult.SUCCESS
         else:
-            print("  ⚠ Invalid choice. Press ENTER to record or 'q' to quit.")
+            print("  ⚠ Invalid choice. Press ENTER to record, 'b' to bulk record or 'q' to quit.")
             return StateResult.SUCCESS
 
 
@@ -70,7 +125,7 @@ class RecordPositionState(RecorderState):
             
             # Parse the JSON response
             try:
-                data = json.loads(response.text)
+                data = parse_t105_fields(response.content)
                 
                 # Extract both joint angles AND XYZ coordinates from T:105 response
                 has_joints = all(key in data for key in ['b', 's', 'e', 't', 'r', 'g'])
@@ -123,7 +178,7 @@ class RecordPositionState(RecorderState):
                     print(f"  ⚠ Response missing required fields")
                     print(f"  Raw response: {response.text}")
                 
-            except json.JSONDecodeError:
+            except ValueError:
                 print(f"  ⚠ Could not parse JSON response")
                 print(f"  Raw response: {response.text}")
             
@@ -140,13 +195,77 @@ class RecordPositionState(RecorderState):
             return StateResult.FAILURE
 
 
+class BulkRecordState(RecorderState):
+    """Stream T:105 at a fixed rate and convert every sample to T:102 format"""
+    
+    def __init__(self, samples: int, interval: float):
+        super().__init__("BulkRecord")
+        self.samples = samples
+        self.interval = interval
+    
+    def execute(self, ip_addr: str) -> StateResult:
+        print("\n" + "-"*60)
+        print(f"  Bulk recording {self.samples} samples every {self.interval}s...")
+        print("  Move the arm through the motion now.")
+        print("-"*60)
+        
+        url = f"http://{ip_addr}/js?json=" + '{"T":105}'
+        raw_samples = []
+        session = requests.Session()
+        
+        # Only collect raw bytes while sampling so parsing and printing
+        # don't stretch the interval; everything is parsed afterwards
+        try:
+            next_at = time.monotonic()
+            for _ in range(self.samples):
+                raw_samples.append(session.get(url, timeout=5).content)
+                next_at += self.interval
+                time.sleep(max(0.0, next_at - time.monotonic()))
+        except KeyboardInterrupt:
+            print("  ⊘ Sampling stopped early")
+        except requests.exceptions.RequestException as e:
+            print(f"  ✗ HTTP error: {e}")
+        finally:
+            session.close()
+        
+        if not raw_samples:
+            return StateResult.FAILURE
+        
+        lines = []
+        skipped = 0
+        for raw in raw_samples:
+            try:
+                data = parse_t105_fields(raw)
+            except ValueError:
+                skipped += 1
+                continue
+            if not all(key in data for key in ['b', 's', 'e', 't', 'r', 'g']):
+                skipped += 1
+                continue
+            lines.append(
+                f'(make_t102_command({data["b"]}, {data["s"]}, {data["e"]}, '
+                f'{data["t"]}, {data["r"]}, {data["g"]}), {self.interval}),'
+            )
+        
+        print("\n" + "="*60)
+        print(f"  ✓ {len(lines)} POSITIONS RECORDED")
+        if skipped:
+            print(f"  ⚠ {skipped} samples could not be parsed")
+        print("="*60)
+        print("\n".join(f"    {line}" for line in lines))
+        print("="*60 + "\n")
+        
+        return StateResult.SUCCESS if lines else StateResult.FAILURE
+
+
 class RecorderStateMachine:
     """State machine for recording robot positions"""
     
-    def __init__(self, ip_addr: str):
+    def __init__(self, ip_addr: str, bulk_samples: int = 50, bulk_interval: float = 0.1):
         self.ip_addr = ip_addr
         self.menu_state = MenuState()
         self.record_state = RecordPositionState()
+        self.bulk_state = BulkRecordState(bulk_samples, bulk_interval)
     
     def run(self):
         """Run the recorder state machine"""
@@ -170,6 +289,12 @@ class RecorderStateMachine:
                     print("="*60 + "\n")
                     break
                 
+                if result == StateResult.BULK:
+                    result = self.bulk_state.execute(self.ip_addr)
+                    if result == StateResult.FAILURE:
+                        print("  ⚠ Bulk recording failed. Try again.")
+                    continue
+                
                 # Record position
                 result = self.record_state.execute(self.ip_addr)
                 
@@ -187,10 +312,14 @@ def main():
         description="Record robot arm positions in both T:102 and T:1041 formats"
     )
     parser.add_argument("ip", type=str, help="IP address (e.g., 192.168.4.1)")
+    parser.add_argument("--bulk-samples", type=int, default=50,
+                        help="Samples taken by bulk record (default: 50)")
+    parser.add_argument("--bulk-interval", type=float, default=0.1,
+                        help="Seconds between bulk record samples (default: 0.1)")
     args = parser.parse_args()
     
     # Create and run the recorder
-    recorder = RecorderStateMachine(args.ip)
+    recorder = RecorderStateMachine(args.ip, args.bulk_samples, args.bulk_interval)
     recorder.run()
 
 
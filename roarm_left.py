@@ -1,6 +1,8 @@
-import requests
 import argparse
+import http.client
+import socket
 import time
+from urllib.parse import quote
 from enum import Enum, auto
 from typing import List, Tuple, Optional
 
@@ -12,34 +14,83 @@ class StateResult(Enum):
     ABORT = auto()
 
 
+# ============================================================================
+# HTTP CONNECTION - Persistent client for the arm's /js endpoint
+# ============================================================================
+class ArmConnection:
+    """
+    Minimal keep-alive HTTP/1.1 client for the arm.
+    Every request is a tiny GET to the same host, so this skips the
+    requests/urllib3 machinery (pool lookup, hooks, cookies, redirects)
+    and talks to one http.client connection directly.
+    """
+    
+    def __init__(self, ip_addr: str, timeout: float = 5):
+        # No explicit port: http.client parses "host:port" and defaults to 80
+        self._conn = http.client.HTTPConnection(ip_addr, timeout=timeout)
+    
+    def get(self, path: str) -> Tuple[int, bytes]:
+        """Send a GET and return (status_code, body)"""
+        try:
+            return self._round_trip(path)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The arm drops idle keep-alive connections (e.g. while waiting
+            # for input). T:102 is an absolute pose, so resending is safe.
+            return self._round_trip(path)
+    
+    def _round_trip(self, path: str) -> Tuple[int, bytes]:
+        try:
+            self._conn.request("GET", path)
+            response = self._conn.getresponse()
+            return response.status, response.read()
+        except Exception:
+            # Reset so the next request opens a fresh connection
+            self._conn.close()
+            raise
+    
+    def close(self):
+        self._conn.close()
+
+
 class RobotState:
     """Base class for robot arm states"""
+
+    # Print full response bodies (set from --verbose in main)
+    verbose = False
     
     def __init__(self, name: str):
         self.name = name
     
-    def execute(self, ip_addr: str) -> StateResult:
+    def execute(self, url_prefix: str, conn: ArmConnection) -> StateResult:
         """
         Execute this state. Override in subclasses.
         Returns StateResult indicating success/failure.
         """
         raise NotImplementedError
     
-    def _send_command(self, ip_addr: str, command_str: str, delay: float) -> StateResult:
+    def _send_command(self, url_prefix: str, conn: ArmConnection,
+                     command_str: str, delay: float) -> StateResult:
         """Helper method to send a command and wait"""
         try:
-            url = f"http://{ip_addr}/js?json={command_str}"
+            # Commands are URL-encoded once at import (see encode_commands)
+            url = url_prefix + command_str
             print(f"    → Sending command...")
-            response = requests.get(url, timeout=5)
-            print(f"    ✓ Response: {response.text}")
+            # The settle delay runs from when the command is sent, so the
+            # round-trip and logging below count against it
+            deadline = time.monotonic() + delay
+            status, body = conn.get(url)
+            if self.verbose:
+                print(f"    ✓ Response: {body.decode(errors='replace')}")
+            else:
+                print(f"    ✓ Response: {status}")
             if delay > 0:
                 print(f"    ⏱  Waiting {delay}s...")
-                time.sleep(delay)
+                time.sleep(max(0.0, deadline - time.monotonic()))
             return StateResult.SUCCESS
-        except requests.exceptions.Timeout:
+        except socket.timeout:
             print(f"    ⚠  Timeout (command may have been sent)")
             return StateResult.SUCCESS
-        except requests.exceptions.RequestException as e:
+        except (OSError, http.client.HTTPException) as e:
             print(f"    ✗ HTTP error: {e}")
             return StateResult.FAILURE
         except Exception as e:
@@ -47,214 +98,149 @@ class RobotState:
             return StateResult.FAILURE
 
 
-# ============================================================================
-# SAMPLE STATE TEMPLATE - Copy and modify this for each new state
-# ============================================================================
-class TemplateState(RobotState):
-    """
-    Template state - copy this for new states.
-    Replace 'Template' with your state name and update commands list.
-    """
-    
-    def __init__(self):
-        super().__init__("Template")
+class SimpleRobotState(RobotState):
+    """State that executes a fixed sequence of commands with delays"""
+
+    # Each step is its own T:102 request: the firmware's JSON interface has no
+    # buffered multi-waypoint command, so a trajectory can't be sent in one go.
+    # Round-trips are hidden behind the step delays in _send_command instead.
+
+    def __init__(self, name: str, commands: Tuple[Tuple[str, float], ...]):
+        super().__init__(name)
+        self.commands = commands
     
-    def execute(self, ip_addr: str) -> StateResult:
+    def execute(self, url_prefix: str, conn: ArmConnection) -> StateResult:
         print(f"\n{'='*60}")
         print(f"  STATE: {self.name}")
         print(f"{'='*60}")
         
-        # Define your command sequence here
-        # Format: (command_string, delay_in_seconds)
-        commands: List[Tuple[str, float]] = [
-            ('{"T":102,"base":0.0,"shoulder":0.0,"elbow":0.0,"wrist":0.0,"roll":0.0,"hand":0.0,"spd":0,"acc":10}', 2.0),
-        ]
-        
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
+        n = len(self.commands)
+        send_command = self._send_command
+        for i, (command, delay) in enumerate(self.commands, 1):
+            print(f"  Step {i}/{n}:")
+            result = send_command(url_prefix, conn, command, delay)
             if result != StateResult.SUCCESS:
                 return result
-        
         return StateResult.SUCCESS
 
 
+# ============================================================================
+# COMMAND SEQUENCES - Built once at import, shared by every state instance
+# Format: (command_string, delay_in_seconds)
+# ============================================================================
+def encode_commands(commands: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[str, float], ...]:
+    """URL-encode each command once so sending it is a plain concatenation"""
+    return tuple((quote(command, safe=":,"), delay) for command, delay in commands)
+
+
+TEMPLATE_COMMANDS = encode_commands((
+    ('{"T":102,"base":0.0,"shoulder":0.0,"elbow":0.0,"wrist":0.0,"roll":0.0,"hand":0.0,"spd":0,"acc":10}', 2.0),
+))
+
+HOME_COMMANDS = encode_commands((
+    ('{"T":102,"base":0.033747577,"shoulder":-0.093572828,"elbow":1.610679827,"wrist":0.013805827,"roll":0,"hand":1.578466231,"spd":0,"acc":50}', 1.0),
+))
+
+LEFT_PICKUP_COMMANDS = encode_commands((
+    #Initial Pos
+    ('{"T":102,"base":1.333029305,"shoulder":-0.187145656,"elbow":2.296369239,"wrist":1.164291418,"roll":2.925301362,"hand":2.813320765,"spd":0,"acc":100}', 1.0),
+    
+    #Go Down
+    ('{"T":102,"base":1.279339977,"shoulder":0.230097118,"elbow":2.58935957,"wrist":0.527689391,"roll":2.925301362,"hand":2.813320765,"spd":0,"acc":100}', 2.0),
+    #close claw
+    ('{"T":102,"base":1.279339977,"shoulder":0.230097118,"elbow":2.58935957,"wrist":0.527689391,"roll":2.925301362,"hand":3.112447019,"spd":0,"acc":100}', 0.75),
+    
+    #lift up
+    ('{"T":102,"base":1.412971055,"shoulder":-0.159534002,"elbow":2.370000317,"wrist":1.015495282,"roll":2.906893593,"hand":3.126252846,"spd":0,"acc":100}',1.25),
+))
+
+MIDDLE_DROPOFF_COMMANDS = encode_commands((
+    ('{"T":102,"base":0.348213639,"shoulder":0.059825251,"elbow":2.126097372,"wrist":1.113670052,"roll":1.915942004,"hand":3.113980999,"spd":0,"acc":100}', 0.75),
+    ('{"T":102,"base":0.348213639,"shoulder":0.059825251,"elbow":2.126097372,"wrist":1.113670052,"roll":1.915942004,"hand":2.736621726,"spd":0,"acc":100}', 0.5),
+))
+
+FRONT_DROPOFF_COMMANDS = encode_commands((
+    (' {"T":102,"base":0.644271931,"shoulder":0.187145656,"elbow":1.958893466,"wrist":1.191903072,"roll":2.262621662,"hand":3.123980999,"spd":0,"acc":100}', 0.75),
+    (' {"T":102,"base":0.644271931,"shoulder":0.187145656,"elbow":1.958893466,"wrist":1.191903072,"roll":2.262621662,"hand":2.736621726,"spd":0,"acc":100}', 0.5),
+))
+
+BACK_DROPOFF_COMMANDS = encode_commands((
+    ('{"T":102,"base":-0.09817477,"shoulder":0.018407769,"elbow":2.185922623,"wrist":1.063048686,"roll":1.481825441,"hand":3.224835364,"spd":0,"acc":100}', 1.0),
+    ('{"T":102,"base":-0.09817477,"shoulder":0.018407769,"elbow":2.185922623,"wrist":1.063048686,"roll":1.481825441,"hand":2.736621726,"spd":0,"acc":100}', 0.75),
+))
+
+PUSH_OFF_COMMANDS = encode_commands((
+    ('{"T":102,"base":0.931126338,"shoulder":0.352815581,"elbow":1.684310905,"wrist":1.175029284,"roll":0.943398185,"hand":3.121650903,"spd":0,"acc":100}',1.0),
+    ('{"T":102,"base":0.920388473,"shoulder":0.415708794,"elbow":1.998776967,"wrist":0.81761176,"roll":1.004757416,"hand":3.121650903,"spd":0,"acc":100}', 0.75),
+    ('{"T":102,"base":-0.403436947,"shoulder":0.181009733,"elbow":2.462039165,"wrist":0.559902988,"roll":-0.391165101,"hand":3.118582942,"spd":0,"acc":100}', 1.25),
+))
+
+PUSH_ON_COMMANDS = encode_commands((
+    ('{"T":102,"base":-0.242368964,"shoulder":-0.073631078,"elbow":2.02485464,"wrist":1.283941919,"roll":-0.302194215,"hand":3.118582942,"spd":0,"acc":10}',1.5),
+    ('{"T":102,"base":0.862097203,"shoulder":0.162601964,"elbow":1.681242944,"wrist":1.374446786,"roll":0.776194279,"hand":3.113980999,"spd":0,"acc":10}',2.0),
+    ('{"T":102,"base":1.141281706,"shoulder":0.794602048,"elbow":0.682621451,"wrist":1.529378846,"roll":1.038504993,"hand":3.106311095,"spd":0,"acc":10}',2.5),
+    ('{"T":102,"base":1.141281706,"shoulder":0.951068088,"elbow":0.690291355,"wrist":1.472621556,"roll":1.12900986,"hand":3.109379057,"spd":0,"acc":10}',1.0),
+    ('{"T":102,"base":1.113670052,"shoulder":0.656543777,"elbow":1.435806017,"wrist":1.135145783,"roll":1.12900986,"hand":3.112447019,"spd":0,"acc":10}',1.25),
+    ('{"T":102,"base":0.882038953,"shoulder":0.460194236,"elbow":1.94662162,"wrist":0.960271973,"roll":0.983281685,"hand":3.121650903,"spd":0,"acc":10}',1.5),
+    ('{"T":102,"base":0.883572934,"shoulder":0.274582561,"elbow":1.702718675,"wrist":1.288543862,"roll":0.912718569,"hand":3.113980999,"spd":0,"acc":10}',1.0),
+))
+
+
+# ============================================================================
+# SAMPLE STATE TEMPLATE - Copy and modify this for each new state
+# ============================================================================
+class TemplateState(SimpleRobotState):
+    """
+    Template state - copy this for new states.
+    Replace 'Template' with your state name and add a commands tuple above.
+    """
+    
+    def __init__(self):
+        super().__init__("Template", TEMPLATE_COMMANDS)
+
+
 # ============================================================================
 # ACTUAL STATES - Your robot arm states
 # ============================================================================
-class HomeState(RobotState):
+class HomeState(SimpleRobotState):
     """Return robot arm to home position"""
-    
     def __init__(self):
-        super().__init__("Home")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            ('{"T":102,"base":0.033747577,"shoulder":-0.093572828,"elbow":1.610679827,"wrist":0.013805827,"roll":0,"hand":1.578466231,"spd":0,"acc":50}', 1.0),
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Home", HOME_COMMANDS)
 
 
-class LeftPickupState(RobotState):
+class LeftPickupState(SimpleRobotState):
     """Execute left pickup sequence"""
-    
     def __init__(self):
-        super().__init__("Left Pickup")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            #Initial Pos
-            ('{"T":102,"base":1.333029305,"shoulder":-0.187145656,"elbow":2.296369239,"wrist":1.164291418,"roll":2.925301362,"hand":2.813320765,"spd":0,"acc":100}', 1.0),
-            
-            #Go Down
-            ('{"T":102,"base":1.279339977,"shoulder":0.230097118,"elbow":2.58935957,"wrist":0.527689391,"roll":2.925301362,"hand":2.813320765,"spd":0,"acc":100}', 2.0),
-            #close claw
-            ('{"T":102,"base":1.279339977,"shoulder":0.230097118,"elbow":2.58935957,"wrist":0.527689391,"roll":2.925301362,"hand":3.112447019,"spd":0,"acc":100}', 0.75),
-            
-            #lift up
-            ('{"T":102,"base":1.412971055,"shoulder":-0.159534002,"elbow":2.370000317,"wrist":1.015495282,"roll":2.906893593,"hand":3.126252846,"spd":0,"acc":100}',1.25)
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Left Pickup", LEFT_PICKUP_COMMANDS)
 
 
-class MiddleDropoffState(RobotState):
+class MiddleDropoffState(SimpleRobotState):
     """Execute middle dropoff sequence"""
-    
     def __init__(self):
-        super().__init__("Middle Dropoff")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            
-            ('{"T":102,"base":0.348213639,"shoulder":0.059825251,"elbow":2.126097372,"wrist":1.113670052,"roll":1.915942004,"hand":3.113980999,"spd":0,"acc":100}', 0.75),
-            ('{"T":102,"base":0.348213639,"shoulder":0.059825251,"elbow":2.126097372,"wrist":1.113670052,"roll":1.915942004,"hand":2.736621726,"spd":0,"acc":100}', 0.5),
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Middle Dropoff", MIDDLE_DROPOFF_COMMANDS)
 
 
-class FrontDropoffState(RobotState):
+class FrontDropoffState(SimpleRobotState):
     """Execute front dropoff sequence"""
-    
     def __init__(self):
-        super().__init__("Front Dropoff")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            
-            (' {"T":102,"base":0.644271931,"shoulder":0.187145656,"elbow":1.958893466,"wrist":1.191903072,"roll":2.262621662,"hand":3.123980999,"spd":0,"acc":100}', 0.75),
-            (' {"T":102,"base":0.644271931,"shoulder":0.187145656,"elbow":1.958893466,"wrist":1.191903072,"roll":2.262621662,"hand":2.736621726,"spd":0,"acc":100}', 0.5),
-
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Front Dropoff", FRONT_DROPOFF_COMMANDS)
 
 
-class BackDropoffState(RobotState):
+class BackDropoffState(SimpleRobotState):
     """Execute back dropoff sequence"""
-    
     def __init__(self):
-        super().__init__("Back Dropoff")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            ('{"T":102,"base":-0.09817477,"shoulder":0.018407769,"elbow":2.185922623,"wrist":1.063048686,"roll":1.481825441,"hand":3.224835364,"spd":0,"acc":100}', 1.0),
-            ('{"T":102,"base":-0.09817477,"shoulder":0.018407769,"elbow":2.185922623,"wrist":1.063048686,"roll":1.481825441,"hand":2.736621726,"spd":0,"acc":100}', 0.75),
-
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Back Dropoff", BACK_DROPOFF_COMMANDS)
     
 
-class PushOffState(RobotState):
+class PushOffState(SimpleRobotState):
     """Execute push off  sequence"""
-    
     def __init__(self):
-        super().__init__("Middle Dropoff")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            ('{"T":102,"base":0.931126338,"shoulder":0.352815581,"elbow":1.684310905,"wrist":1.175029284,"roll":0.943398185,"hand":3.121650903,"spd":0,"acc":100}',1.0),
-            ('{"T":102,"base":0.920388473,"shoulder":0.415708794,"elbow":1.998776967,"wrist":0.81761176,"roll":1.004757416,"hand":3.121650903,"spd":0,"acc":100}', 0.75),
-            ('{"T":102,"base":-0.403436947,"shoulder":0.181009733,"elbow":2.462039165,"wrist":0.559902988,"roll":-0.391165101,"hand":3.118582942,"spd":0,"acc":100}', 1.25),
-            
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Middle Dropoff", PUSH_OFF_COMMANDS)
 
-class PushOnState(RobotState):
+class PushOnState(SimpleRobotState):
     """Execute push on sequence"""
-    
     def __init__(self):
-        super().__init__("Middle Dropoff")
-    
-    def execute(self, ip_addr: str) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-        commands = [
-            ('{"T":102,"base":-0.242368964,"shoulder":-0.073631078,"elbow":2.02485464,"wrist":1.283941919,"roll":-0.302194215,"hand":3.118582942,"spd":0,"acc":10}',1.5),
-            ('{"T":102,"base":0.862097203,"shoulder":0.162601964,"elbow":1.681242944,"wrist":1.374446786,"roll":0.776194279,"hand":3.113980999,"spd":0,"acc":10}',2.0),
-            ('{"T":102,"base":1.141281706,"shoulder":0.794602048,"elbow":0.682621451,"wrist":1.529378846,"roll":1.038504993,"hand":3.106311095,"spd":0,"acc":10}',2.5),
-            ('{"T":102,"base":1.141281706,"shoulder":0.951068088,"elbow":0.690291355,"wrist":1.472621556,"roll":1.12900986,"hand":3.109379057,"spd":0,"acc":10}',1.0),
-            ('{"T":102,"base":1.113670052,"shoulder":0.656543777,"elbow":1.435806017,"wrist":1.135145783,"roll":1.12900986,"hand":3.112447019,"spd":0,"acc":10}',1.25),
-            ('{"T":102,"base":0.882038953,"shoulder":0.460194236,"elbow":1.94662162,"wrist":0.960271973,"roll":0.983281685,"hand":3.121650903,"spd":0,"acc":10}',1.5),
-            ('{"T":102,"base":0.883572934,"shoulder":0.274582561,"elbow":1.702718675,"wrist":1.288543862,"roll":0.912718569,"hand":3.113980999,"spd":0,"acc":10}',1.0),
-            
-           
-
-
-        ]
-        for i, (command, delay) in enumerate(commands, 1):
-            print(f"  Step {i}/{len(commands)}:")
-            result = self._send_command(ip_addr, command, delay)
-            if result != StateResult.SUCCESS:
-                return result
-        return StateResult.SUCCESS
+        super().__init__("Middle Dropoff", PUSH_ON_COMMANDS)
 
 
 class WaitForInputState(RobotState):
@@ -263,7 +249,7 @@ class WaitForInputState(RobotState):
     def __init__(self):
         super().__init__("Wait For Input")
     
-    def execute(self, ip_addr: str) -> StateResult:
+    def execute(self, url_prefix: str, conn: ArmConnection) -> StateResult:
         print(f"\n{'='*60}")
         print(f"  STATE: {self.name}")
         print(f"{'='*60}")
@@ -284,6 +270,10 @@ class StateMachine:
     
     def __init__(self, ip_addr: str):
         self.ip_addr = ip_addr
+        # Path every command is appended to
+        self.url_prefix = "/js?json="
+        # One keep-alive connection reused for every command in the run
+        self.conn = ArmConnection(ip_addr)
         self.states: List[RobotState] = []
     
     def add_state(self, state: RobotState):
@@ -296,21 +286,22 @@ class StateMachine:
         print("\n" + "="*60)
         print(f"  ROBOT ARM STATE MACHINE")
         print(f"  Target IP: {self.ip_addr}")
-        print(f"  Total States: {len(self.states)}")
+        n = len(self.states)
+        print(f"  Total States: {n}")
         print("="*60)
         
         try:
             for i, state in enumerate(self.states, 1):
-                print(f"\n[{i}/{len(self.states)}] Starting: {state.name}")
-                result = state.execute(self.ip_addr)
+                print(f"\n[{i}/{n}] Starting: {state.name}")
+                result = state.execute(self.url_prefix, self.conn)
                 
                 if result == StateResult.SUCCESS:
-                    print(f"[{i}/{len(self.states)}] ✓ COMPLETED: {state.name}")
+                    print(f"[{i}/{n}] ✓ COMPLETED: {state.name}")
                 elif result == StateResult.ABORT:
-                    print(f"[{i}/{len(self.states)}] ⊘ ABORTED")
+                    print(f"[{i}/{n}] ⊘ ABORTED")
                     return
                 else:
-                    print(f"[{i}/{len(self.states)}] ✗ FAILED: {state.name}")
+                    print(f"[{i}/{n}] ✗ FAILED: {state.name}")
                     return
             
             print("\n" + "="*60)
@@ -321,6 +312,8 @@ class StateMachine:
             print("\n\n" + "="*60)
             print("  ⊘ Program terminated by user (Ctrl+C)")
             print("="*60 + "\n")
+        finally:
+            self.conn.close()
 
 
 # ============================================================================
@@ -329,7 +322,9 @@ class StateMachine:
 def main():
     parser = argparse.ArgumentParser(description="Robot Arm State Machine Controller")
     parser.add_argument("ip", type=str, help="IP address (e.g., 192.168.4.1)")
+    parser.add_argument("--verbose", action="store_true", help="Print full command responses")
     args = parser.parse_args()
+    RobotState.verbose = args.verbose
     
     # ========================================
     # CONFIGURE YOUR STATE SEQUENCE HERE
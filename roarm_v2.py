@@ -15,12 +15,15 @@ class StateResult(Enum):
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
+_T102_TEMPLATE = ('{"T":102,"base":%r,"shoulder":%r,"elbow":%r,'
+                  '"wrist":%r,"roll":%r,"hand":%r,"spd":%d,"acc":%d}')
+
+
 def make_t102_command(base: float, shoulder: float, elbow: float, 
                       wrist: float, roll: float, hand: float, 
                       spd: int = 0, acc: int = 255) -> str:
     """Generate T:102 command string"""
-    return (f'{{"T":102,"base":{base},"shoulder":{shoulder},"elbow":{elbow},'
-            f'"wrist":{wrist},"roll":{roll},"hand":{hand},"spd":{spd},"acc":{acc}}}')
+    return _T102_TEMPLATE % (base, shoulder, elbow, wrist, roll, hand, spd, acc)
 
 
 # ============================================================================
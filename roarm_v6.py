@@ -1,21 +1,45 @@
 import requests
 import argparse
+import functools
+import http.client
+import logging
+import selectors
+import socket
+import sys
 import time
-from enum import Enum, auto
-from typing import List, Tuple, Dict
+from collections import deque
+from enum import IntEnum
+from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
+from urllib.parse import quote, urlsplit
 
 
-class StateResult(Enum):
-    """Return values for state execution"""
-    SUCCESS = auto()
-    FAILURE = auto()
-    ABORT = auto()
+# Per-step progress goes through logging so it costs nothing unless --verbose
+logger = logging.getLogger(__name__)
 
+# While waiting on the operator, query the arm this often so the keep-alive
+# connection isn't dropped and the next command doesn't pay for a reconnect
+KEEPALIVE_INTERVAL = 1.0
+T105_QUERY = quote('{"T":105}', safe=":,")
 
-@dataclass
+
+class StateResult(IntEnum):
+    """Return values for state execution (ints, so run() compares cheaply)"""
+    SUCCESS = 0
+    FAILURE = 1
+    ABORT = 2
+    REPEAT = 100
+
+
+# DropoffSelectionState returns DROPOFF_BASE + the selected number key
+DROPOFF_BASE = 200
+
+
+@dataclass(frozen=True)
 class RobotPose:
-    """Represents a robot arm joint configuration"""
+    """Represents a robot arm joint configuration (immutable, so it can be shared)"""
+    __slots__ = ("base", "shoulder", "elbow", "wrist", "roll", "hand")
+
     base: float
     shoulder: float
     elbow: float
@@ -24,84 +48,165 @@ class RobotPose:
     hand: float
 
 
+_T102_TEMPLATE = ('{"T":102,"base":%r,"shoulder":%r,"elbow":%r,'
+                  '"wrist":%r,"roll":%r,"hand":%r,"spd":%d,"acc":%d}')
+
+
 def make_t102_command(pose: RobotPose, spd: int = 0, acc: int = 254) -> str:
     """Generate T:102 command string from a pose"""
-    return (f'{{"T":102,"base":{pose.base},"shoulder":{pose.shoulder},'
-            f'"elbow":{pose.elbow},"wrist":{pose.wrist},"roll":{pose.roll},'
-            f'"hand":{pose.hand},"spd":{spd},"acc":{acc}}}')
+    return _T102_TEMPLATE % (pose.base, pose.shoulder, pose.elbow,
+                             pose.wrist, pose.roll, pose.hand, spd, acc)
+
+
+class ArmConnection:
+    """
+    Minimal keep-alive HTTP/1.1 client for the arm's /js endpoint.
+    Uses one http.client connection (TCP_NODELAY is set on connect) so each
+    command skips the requests/urllib3 layers entirely.
+    """
+
+    def __init__(self, host: str, port: Optional[int] = None, timeout: float = 0.2):
+        # port=None lets http.client default to 80
+        self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def get(self, path: str) -> Tuple[int, bytes]:
+        """Send a GET and return (status_code, body)"""
+        try:
+            return self._round_trip(path)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The arm closed an idle keep-alive connection; T:102 is an
+            # absolute pose, so sending it again on a new one is safe
+            return self._round_trip(path)
+
+    def _round_trip(self, path: str) -> Tuple[int, bytes]:
+        try:
+            self._conn.request("GET", path)
+            response = self._conn.getresponse()
+            return response.status, response.read()
+        except Exception:
+            # Reset so the next request opens a fresh connection
+            self._conn.close()
+            raise
+
+    def close(self):
+        self._conn.close()
 
 
 class RobotState:
     """Base class for robot arm states"""
 
+    # States that keep no per-run data can be built once and reused every
+    # time their name appears in a sequence. Set False in stateful subclasses.
+    SHAREABLE = True
+
     def __init__(self, name: str):
         self.name = name
 
-    def execute(self, ip_addr: str, session: requests.Session) -> StateResult:
+    def execute(self, url_prefix: str, conn: ArmConnection) -> StateResult:
         """Execute this state. Override in subclasses."""
         raise NotImplementedError
 
-    def _send_command(self, ip_addr: str, session: requests.Session,
+    def _prompt(self, prompt: str, url_prefix: str, conn: ArmConnection) -> str:
+        """
+        Read a line from the operator, sending a T:105 heartbeat every
+        KEEPALIVE_INTERVAL seconds until it arrives. Falls back to a plain
+        input() where stdin can't be polled (Windows consoles, pipes).
+        """
+        # select() on Windows only accepts sockets, not the console handle
+        if sys.platform == "win32" or not sys.stdin.isatty():
+            return input(prompt)
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            sel.close()
+            return input(prompt)
+
+        try:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            while not sel.select(KEEPALIVE_INTERVAL):
+                try:
+                    conn.get(url_prefix + T105_QUERY)
+                except (OSError, http.client.HTTPException):
+                    pass  # the next real command reconnects
+            line = sys.stdin.readline()
+        finally:
+            sel.close()
+        if not line:
+            raise EOFError
+        return line
+
+    def _send_command(self, url_prefix: str, conn: ArmConnection,
                      command_str: str, delay: float) -> StateResult:
         """Helper method to send a command and wait"""
+        logger.info("    → Sending command...")
+        # The motion delay runs from when the command is sent, so the
+        # HTTP round-trip is hidden inside it rather than added to it
+        deadline = time.monotonic() + delay
         try:
-            url = f"http://{ip_addr}/js?json={command_str}"
-            print(f"    → Sending command...")
-            response = session.get(url, timeout=0.2)
-            print(f"    ✓ Response: {response.text}")
+            # Commands are URL-encoded once when built (see build_commands)
+            status, body = conn.get(url_prefix + command_str)
+            if logger.isEnabledFor(logging.INFO):
+                # Only decode the body when it will actually be shown
+                logger.info("    ✓ Response: %s", body.decode(errors="replace"))
 
             if delay > 0:
-                print(f"    ⏱  Waiting {delay}s...")
-                time.sleep(delay)
-
-            return StateResult.SUCCESS
-        except requests.exceptions.Timeout:
-            print(f"    ⚠  Timeout (command may have been sent)")
-            return StateResult.SUCCESS
-        except requests.exceptions.RequestException as e:
-            print(f"    ✗ HTTP error: {e}")
-            return StateResult.FAILURE
+                logger.info("    ⏱  Waiting %ss...", delay)
+            result = StateResult.SUCCESS
+        except socket.timeout:
+            logger.warning("    ⚠  Timeout (command may have been sent)")
+            result = StateResult.SUCCESS
+        except (OSError, http.client.HTTPException) as e:
+            logger.error("    ✗ HTTP error: %s", e)
+            result = StateResult.FAILURE
         except Exception as e:
-            print(f"    ✗ Unexpected error: {e}")
-            return StateResult.FAILURE
+            logger.error("    ✗ Unexpected error: %s", e)
+            result = StateResult.FAILURE
+
+        # Let the motion finish even if the response timed out, so the next
+        # pose isn't sent while the arm is still moving. Not in a finally, so
+        # Ctrl+C during the request aborts straight away.
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        return result
 
 
 class SimpleRobotState(RobotState):
     """State that executes a sequence of poses with delays"""
 
-    def __init__(self, name: str, commands: List[Tuple[str, float]]):
+    def __init__(self, name: str, commands: Tuple[Tuple[str, float], ...]):
         super().__init__(name)
         self.commands = commands
-
-    def execute(self, ip_addr: str, session: requests.Session) -> StateResult:
-        print(f"\n{'='*60}")
-        print(f"  STATE: {self.name}")
-        print(f"{'='*60}")
-
-        for i, (command, delay) in enumerate(self.commands, 1):
-            print(f"  Step {i}/{len(self.commands)}:")
-            result = self._send_command(ip_addr, session, command, delay)
+        # Header and step lines are fixed per state, so format them once
+        self._banner = f"\n{'='*60}\n  STATE: {name}\n{'='*60}"
+        n = len(commands)
+        self._step_lines = tuple(f"  Step {i}/{n}:" for i in range(1, n + 1))
+
+    def execute(self, url_prefix: str, conn: ArmConnection) -> StateResult:
+        logger.info(self._banner)
+
+        send_command = self._send_command
+        for line, (command, delay) in zip(self._step_lines, self.commands):
+            logger.info(line)
+            result = send_command(url_prefix, conn, command, delay)
             if result != StateResult.SUCCESS:
                 return result
         return StateResult.SUCCESS
 
 
-class PoseState(SimpleRobotState):
-    """Convenience class to create states from RobotPose objects"""
-
-    def __init__(self, name: str, poses: List[Tuple[RobotPose, float]], acc: int = 255):
-        commands = [(make_t102_command(pose, acc=acc), delay) for pose, delay in poses]
-        super().__init__(name, commands)
-
-
 class DropoffSelectionState(RobotState):
     """State that prompts user to select a dropoff location"""
 
     def __init__(self, name: str, dropoff_map: Dict[str, str]):
         super().__init__(name)
+        # A selection is returned as DROPOFF_BASE + key, so keys must be numbers
+        for key in dropoff_map:
+            if not key.isdigit():
+                raise ValueError(f"Dropoff key {key!r} must be a number")
         self.dropoff_map = dropoff_map
 
-    def execute(self, ip_addr: str, session: requests.Session) -> StateResult:
+    def execute(self, url_prefix: str, conn: ArmConnection) -> int:
+        """Return a StateResult, or DROPOFF_BASE + the selected key"""
         print(f"\n{'='*60}")
         print(f"  STATE: {self.name}")
         print(f"{'='*60}")
@@ -112,7 +217,7 @@ class DropoffSelectionState(RobotState):
         print(f"     [a] Abort")
 
         try:
-            user_input = input("  → ").lower().strip()
+            user_input = self._prompt("  → ", url_prefix, conn).lower().strip()
 
             if user_input == 's':
                 print("  ↷ Skipping dropoff")
@@ -122,7 +227,7 @@ class DropoffSelectionState(RobotState):
                 return StateResult.ABORT
             elif user_input in self.dropoff_map:
                 print(f"  ✓ Selected: {self.dropoff_map[user_input]}")
-                return user_input  # Return the key to indicate which dropoff to use
+                return DROPOFF_BASE + int(user_input)  # Encodes which dropoff to use
             else:
                 print(f"  ✗ Invalid selection: {user_input}")
                 return StateResult.FAILURE
@@ -134,7 +239,7 @@ class DropoffSelectionState(RobotState):
 class WaitForInputState(RobotState):
     """Pause and wait for user input with manual overrides"""
 
-    def execute(self, ip_addr: str, session: requests.Session) -> StateResult:
+    def execute(self, url_prefix: str, conn: ArmConnection) -> StateResult:
         print(f"\n{'='*60}")
         print(f"  STATE: {self.name}")
         print(f"{'='*60}")
@@ -142,14 +247,14 @@ class WaitForInputState(RobotState):
         print(f"     [s] Skip to next state")
         print(f"     [r] Repeat previous state")
         try:
-            user_input = input("  → ").lower().strip()
+            user_input = self._prompt("  → ", url_prefix, conn).lower().strip()
 
             if user_input == 's':
                 print("  ↷ Skipping to next state")
                 return StateResult.SUCCESS
             elif user_input == 'r':
                 print("  ↶ Repeating previous state")
-                return "REPEAT"
+                return StateResult.REPEAT
             else:
                 print("  ✓ Continuing")
                 return StateResult.SUCCESS
@@ -158,86 +263,117 @@ class WaitForInputState(RobotState):
             return StateResult.ABORT
 
 
-# Pose definitions
-HOME_POSE = RobotPose(1.553922538, -0.113514578, 2.406815856, 0.905048665, -0.076699039, 2.664524629)
+# Pose definitions. Many sequences revisit the same joint configuration, so
+# poses are interned: identical joint values share one RobotPose object.
+_POSE_POOL: Dict[Tuple[float, ...], RobotPose] = {}
+
+
+def shared_pose(*joints: float) -> RobotPose:
+    """Return the pooled RobotPose for these joint values, creating it once"""
+    pose = _POSE_POOL.get(joints)
+    if pose is None:
+        pose = _POSE_POOL[joints] = RobotPose(*joints)
+    return pose
+
+
+HOME_POSE = shared_pose(1.553922538, -0.113514578, 2.406815856, 0.905048665, -0.076699039, 2.664524629)
 
 LEFT_PICKUP_POSES = [
-    (RobotPose(1.553922538, -0.113514578, 2.406815856, 0.905048665, -0.076699039, 2.664524629), 0.42),
-    (RobotPose(1.279339977, 0.230097118, 2.58935957, 0.527689391, -0.216291563, 2.553320765), 0.3),
-    (RobotPose(1.290077843, 0.176407791, 2.658388705, 0.40803889, -0.260776734, 3.183301384), 0.15),
-    (RobotPose(1.412971055, -0.159534002, 2.370000317, 1.015495282, -0.234699332, 3.126252846), 0.14),
+    (shared_pose(1.553922538, -0.113514578, 2.406815856, 0.905048665, -0.076699039, 2.664524629), 0.42),
+    (shared_pose(1.279339977, 0.230097118, 2.58935957, 0.527689391, -0.216291563, 2.553320765), 0.3),
+    (shared_pose(1.290077843, 0.176407791, 2.658388705, 0.40803889, -0.260776734, 3.183301384), 0.15),
+    (shared_pose(1.412971055, -0.159534002, 2.370000317, 1.015495282, -0.234699332, 3.126252846), 0.14),
 ]
 
 MIDDLE_DROPOFF_POSES = [
-    (RobotPose(0.401902966, 0.110446617, 2.311709047, 0.852893318, -1.202640938, 3.046485845), 0.55),
-    (RobotPose(0.348213639, 0.059825251, 2.126097372, 1.113670052, -1.225650921, 2.536621726), 0.14),
+    (shared_pose(0.401902966, 0.110446617, 2.311709047, 0.852893318, -1.202640938, 3.046485845), 0.55),
+    (shared_pose(0.348213639, 0.059825251, 2.126097372, 1.113670052, -1.225650921, 2.536621726), 0.14),
 ]
 
 FRONT_DROPOFF_POSES = [
-    (RobotPose(0.584776797, 0.335941793, 1.960427447, 1.11060209, -0.741864204, 3.051087787), 0.62),
-    (RobotPose(0.584776797, 0.335941793, 1.960427447, 1.11060209, -0.741864204, 2.551087787), 0.17),
-    (RobotPose(0.635689412, 0.141126232, 2.034058525, 1.086058398, -0.889708857, 2.758097457), 0.27),
+    (shared_pose(0.584776797, 0.335941793, 1.960427447, 1.11060209, -0.741864204, 3.051087787), 0.62),
+    (shared_pose(0.584776797, 0.335941793, 1.960427447, 1.11060209, -0.741864204, 2.551087787), 0.17),
+    (shared_pose(0.635689412, 0.141126232, 2.034058525, 1.086058398, -0.889708857, 2.758097457), 0.27),
 ]
 
 BACK_DROPOFF_POSES = [
-    (RobotPose(-0.09817477, 0.018407769, 2.205922623, 1.063048686, -1.659767484, 3.224835364), 0.95),
-    (RobotPose(-0.09817477, 0.018407769, 2.205922623, 1.063048686, -1.659767484, 2.536621726), 0.175),
+    (shared_pose(-0.09817477, 0.018407769, 2.205922623, 1.063048686, -1.659767484, 3.224835364), 0.95),
+    (shared_pose(-0.09817477, 0.018407769, 2.205922623, 1.063048686, -1.659767484, 2.536621726), 0.175),
 ]
 
 PUSH_OFF_POSES = [
-    (RobotPose(0.931126338, 0.352815581, 1.684310905, 0.975029284, -0.878971263, 2.721650903), 0.125),
-    (RobotPose(0.920388473, 0.415708794, 1.998776967, 0.65761176, -0.878971263, 3.121650903), 0.23),
-    (RobotPose(-0.403436947, 0.181009733, 2.462039165, 0.559902988, -1.67165101, 3.118582942), 0.5),
+    (shared_pose(0.931126338, 0.352815581, 1.684310905, 0.975029284, -0.878971263, 2.721650903), 0.125),
+    (shared_pose(0.920388473, 0.415708794, 1.998776967, 0.65761176, -0.878971263, 3.121650903), 0.23),
+    (shared_pose(-0.403436947, 0.181009733, 2.462039165, 0.559902988, -1.67165101, 3.118582942), 0.5),
 ]
 
 PUSH_ON_HALF_POSES = [
-    (RobotPose(-0.242368964, -0.073631078, 2.02485464, 1.283941919, -0.302194215, 3.118582942), 0.01),
-    (RobotPose(0.862097203, 0.162601964, 1.681242944, 1.374446786, 0.776194279, 3.113980999), 0.28),
+    (shared_pose(-0.242368964, -0.073631078, 2.02485464, 1.283941919, -0.302194215, 3.118582942), 0.01),
+    (shared_pose(0.862097203, 0.162601964, 1.681242944, 1.374446786, 0.776194279, 3.113980999), 0.28),
 ]
 
 PUSH_ON_FULL_POSES = [
-    (RobotPose(1.141281706, 0.794602048, 0.682621451, 1.529378846, 1.038504993, 3.106311095), 1.6),
-    (RobotPose(1.224116669, 0.849825356, 0.957204012, 1.222582688, 1.199572976, 3.092505268), 0.7),
-    (RobotPose(1.113670052, 0.656543777, 1.435806017, 1.135145783, 1.12900986, 3.112447019), 0.2),
-    (RobotPose(0.882038953, 0.460194236, 1.94662162, 0.960271973, 0.983281685, 3.121650903), 0.2),
-    (RobotPose(0.883572934, 0.274582561, 1.702718675, 1.288543862, 0.912718569, 3.113980999), 0.35),
+    (shared_pose(1.141281706, 0.794602048, 0.682621451, 1.529378846, 1.038504993, 3.106311095), 1.6),
+    (shared_pose(1.224116669, 0.849825356, 0.957204012, 1.222582688, 1.199572976, 3.092505268), 0.7),
+    (shared_pose(1.113670052, 0.656543777, 1.435806017, 1.135145783, 1.12900986, 3.112447019), 0.2),
+    (shared_pose(0.882038953, 0.460194236, 1.94662162, 0.960271973, 0.983281685, 3.121650903), 0.2),
+    (shared_pose(0.883572934, 0.274582561, 1.702718675, 1.288543862, 0.912718569, 3.113980999), 0.35),
 ]
 
 BACK_PUSH_POSES = [
-    (RobotPose(1.141281706, 0.794602048, 0.682621451, 1.529378846, 1.038504993, 3.106311095), 0.52),
-    (RobotPose(1.224116669, 0.849825356, 0.957204012, 1.222582688, 1.199572976, 3.092505268), 0.15),
-    (RobotPose(1.113670052, 0.656543777, 1.435806017, 1.135145783, 1.12900986, 3.112447019), 0.135),
-    (RobotPose(0.882038953, 0.460194236, 1.94662162, 0.960271973, 0.983281685, 3.121650903), 0.1),
-    (RobotPose(0.883572934, 0.274582561, 1.702718675, 1.288543862, 0.912718569, 3.113980999), 0.25),
+    (shared_pose(1.141281706, 0.794602048, 0.682621451, 1.529378846, 1.038504993, 3.106311095), 0.52),
+    (shared_pose(1.224116669, 0.849825356, 0.957204012, 1.222582688, 1.199572976, 3.092505268), 0.15),
+    (shared_pose(1.113670052, 0.656543777, 1.435806017, 1.135145783, 1.12900986, 3.112447019), 0.135),
+    (shared_pose(0.882038953, 0.460194236, 1.94662162, 0.960271973, 0.983281685, 3.121650903), 0.1),
+    (shared_pose(0.883572934, 0.274582561, 1.702718675, 1.288543862, 0.912718569, 3.113980999), 0.25),
 ]
 
 FAR_MIDDLE_POSES = [
-    (RobotPose(1.093728302, 0.608990373, 1.049242859, 1.500233211, -0.549165122, 3.117048961), 2.5),
-    (RobotPose(1.093728302, 0.608990373, 1.049242859, 1.500233211, -0.549165122, 2.517048961), 0.5),
+    (shared_pose(1.093728302, 0.608990373, 1.049242859, 1.500233211, -0.549165122, 3.117048961), 2.5),
+    (shared_pose(1.093728302, 0.608990373, 1.049242859, 1.500233211, -0.549165122, 2.517048961), 0.5),
 ]
 
 
+def build_commands(poses: List[Tuple[RobotPose, float]], acc: int = 255) -> Tuple[Tuple[str, float], ...]:
+    """Serialize a pose sequence into URL-encoded (command_string, delay) pairs"""
+    return tuple((quote(make_t102_command(pose, acc=acc), safe=":,"), delay)
+                 for pose, delay in poses)
+
+
+# Pose states as data: (registry name, display name, poses, acc)
+POSE_STATE_TABLE = (
+    ("Home", "Home", [(HOME_POSE, 0.1)], 255),
+    ("LeftPickup", "Left Pickup", LEFT_PICKUP_POSES, 255),
+    ("MiddleDropoff", "Middle Dropoff", MIDDLE_DROPOFF_POSES, 255),
+    ("FrontDropoff", "Front Dropoff", FRONT_DROPOFF_POSES, 255),
+    ("BackDropoff", "Back Dropoff", BACK_DROPOFF_POSES, 255),
+    ("PushOff", "Push Off", PUSH_OFF_POSES, 255),
+    ("PushOnHalf", "Push On", PUSH_ON_HALF_POSES, 255),
+    ("PushOnFull", "Push On", PUSH_ON_FULL_POSES, 255),
+    ("BackPush", "Back Push", BACK_PUSH_POSES, 255),
+    ("FarMiddle", "Far Middle Dropoff", FAR_MIDDLE_POSES, 255),
+)
+
+# Every pose sequence serialized once at import; states share these tuples
+POSE_COMMANDS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    name: build_commands(poses, acc=acc) for name, _, poses, acc in POSE_STATE_TABLE
+}
+
+
 def create_state_registry():
     """Create the state registry with all available states"""
-    return {
-        "Home": lambda: PoseState("Home", [(HOME_POSE, 0.1)]),
-        "LeftPickup": lambda: PoseState("Left Pickup", LEFT_PICKUP_POSES),
-        "MiddleDropoff": lambda: PoseState("Middle Dropoff", MIDDLE_DROPOFF_POSES),
-        "FrontDropoff": lambda: PoseState("Front Dropoff", FRONT_DROPOFF_POSES),
-        "BackDropoff": lambda: PoseState("Back Dropoff", BACK_DROPOFF_POSES),
-        "PushOff": lambda: PoseState("Push Off", PUSH_OFF_POSES),
-        "PushOnHalf": lambda: PoseState("Push On", PUSH_ON_HALF_POSES, acc=255),
-        "PushOnFull": lambda: PoseState("Push On", PUSH_ON_FULL_POSES, acc=255),
-        "BackPush": lambda: PoseState("Back Push", BACK_PUSH_POSES, acc=255),
-        "FarMiddle": lambda: PoseState("Far Middle Dropoff", FAR_MIDDLE_POSES),
-        "Wait": lambda: WaitForInputState("Wait For Input"),
-        "SelectDropoff": lambda: DropoffSelectionState("Select Dropoff", {
-            "1": "Middle Dropoff",
-            "2": "Front Dropoff",
-            "3": "Back Dropoff",
-            "4": "Far Middle Dropoff"
-        }),
+    registry = {
+        name: functools.partial(SimpleRobotState, label, POSE_COMMANDS[name])
+        for name, label, _, _ in POSE_STATE_TABLE
     }
+    registry["Wait"] = functools.partial(WaitForInputState, "Wait For Input")
+    registry["SelectDropoff"] = functools.partial(DropoffSelectionState, "Select Dropoff", {
+        "1": "Middle Dropoff",
+        "2": "Front Dropoff",
+        "3": "Back Dropoff",
+        "4": "Far Middle Dropoff"
+    })
+    return registry
 
 
 class StateMachine:
@@ -245,9 +381,29 @@ class StateMachine:
 
     def __init__(self, ip_addr: str, state_registry: dict):
         self.ip_addr = ip_addr
-        self.session = requests.Session()
+        # Split off an optional ":port", then resolve the host once so a
+        # hostname isn't looked up again for every command
+        address = urlsplit("//" + ip_addr)
+        host = address.hostname or ip_addr
+        try:
+            host = socket.gethostbyname(host)
+        except OSError:
+            pass
+        self.url_prefix = "/js?json="
+        # Single keep-alive connection reused for every command of the run
+        self.conn = ArmConnection(host, address.port)
         self.states = []
         self.state_registry = state_registry
+        self._state_cache: Dict[str, RobotState] = {}
+
+    def _get_state(self, state_name: str) -> RobotState:
+        """Build a registry state, reusing the existing instance if shareable"""
+        state = self._state_cache.get(state_name)
+        if state is None:
+            state = self.state_registry[state_name]()
+            if state.SHAREABLE:
+                self._state_cache[state_name] = state
+        return state
 
     def add_state(self, state: RobotState) -> 'StateMachine':
         """Add a state to the execution sequence"""
@@ -256,11 +412,11 @@ class StateMachine:
 
     def add_states_from_sequence(self, sequence: List[str]) -> 'StateMachine':
         """Add states from a list of state names"""
-        for state_name in sequence:
-            if state_name in self.state_registry:
-                self.states.append(self.state_registry[state_name]())
-            else:
-                print(f"⚠ Warning: Unknown state '{state_name}' - skipping")
+        # Validate each distinct name once, then build the whole sequence
+        unknown = {name for name in sequence if name not in self.state_registry}
+        for state_name in dict.fromkeys(name for name in sequence if name in unknown):
+            print(f"⚠ Warning: Unknown state '{state_name}' - skipping")
+        self.states.extend(self._get_state(name) for name in sequence if name not in unknown)
         return self
 
     def run(self):
@@ -271,38 +427,47 @@ class StateMachine:
         print(f"  Total States: {len(self.states)}")
         print("="*60)
 
-        # Mapping from selection keys to state names
+        # Mapping from selection numbers to state names
         dropoff_mapping = {
-            "1": "MiddleDropoff",
-            "2": "FrontDropoff",
-            "3": "BackDropoff",
-            "4": "FarMiddle"
+            1: "MiddleDropoff",
+            2: "FrontDropoff",
+            3: "BackDropoff",
+            4: "FarMiddle"
         }
 
+        # States still to run (left end is next) and states already run.
+        # Repeats and injected dropoffs push onto the left of `pending`,
+        # so neither needs an O(n) list insert or index arithmetic.
+        pending = deque(self.states)
+        done: List[RobotState] = []
+
         try:
-            i = 0
-            while i < len(self.states):
-                state = self.states[i]
-                print(f"\n[{i+1}/{len(self.states)}] Starting: {state.name}")
-                result = state.execute(self.ip_addr, self.session)
+            while pending:
+                state = pending.popleft()
+                step, total = len(done) + 1, len(done) + 1 + len(pending)
+                logger.info("\n[%d/%d] Starting: %s", step, total, state.name)
+                result = state.execute(self.url_prefix, self.conn)
 
                 if result == StateResult.SUCCESS:
-                    print(f"[{i+1}/{len(self.states)}] ✓ COMPLETED: {state.name}")
-                    i += 1
-                elif result == "REPEAT":
-                    print(f"[{i+1}/{len(self.states)}] ↶ REPEATING: {state.name}")
-                    i -= 2
-                elif result in dropoff_mapping:
+                    logger.info("[%d/%d] ✓ COMPLETED: %s", step, total, state.name)
+                    done.append(state)
+                elif result == StateResult.REPEAT:
+                    # Run the two states before this one again, then this one
+                    logger.info("[%d/%d] ↶ REPEATING: %s", step, total, state.name)
+                    pending.appendleft(state)
+                    for _ in range(min(2, len(done))):
+                        pending.appendleft(done.pop())
+                elif isinstance(result, int) and result - DROPOFF_BASE in dropoff_mapping:
                     # User selected a dropoff position, inject it into the sequence
-                    dropoff_state_name = dropoff_mapping[result]
-                    print(f"[{i+1}/{len(self.states)}] → INJECTING: {dropoff_state_name}")
-                    self.states.insert(i + 1, self.state_registry[dropoff_state_name]())
-                    i += 1
+                    dropoff_state_name = dropoff_mapping[result - DROPOFF_BASE]
+                    logger.info("[%d/%d] → INJECTING: %s", step, total, dropoff_state_name)
+                    done.append(state)
+                    pending.appendleft(self._get_state(dropoff_state_name))
                 elif result == StateResult.ABORT:
-                    print(f"[{i+1}/{len(self.states)}] ⊘ ABORTED")
+                    logger.warning("[%d/%d] ⊘ ABORTED", step, total)
                     return
                 else:
-                    print(f"[{i+1}/{len(self.states)}] ✗ FAILED: {state.name}")
+                    logger.error("[%d/%d] ✗ FAILED: %s", step, total, state.name)
                     return
 
             print("\n" + "="*60)
@@ -314,7 +479,7 @@ class StateMachine:
             print("  ⊘ Program terminated by user (Ctrl+C)")
             print("="*60 + "\n")
         finally:
-            self.session.close()
+            self.conn.close()
 
 
 def get_joints(ip_addr: str):
@@ -345,8 +510,12 @@ def main():
     parser = argparse.ArgumentParser(description="Robot Arm State Machine Controller")
     parser.add_argument("ip", type=str, help="IP address (e.g., 192.168.4.1)")
     parser.add_argument("--get-joints", action="store_true", help="Get current joint positions")
+    parser.add_argument("--verbose", action="store_true", help="Print per-step progress")
     args = parser.parse_args()
 
+    logging.basicConfig(stream=sys.stdout, format="%(message)s",
+                        level=logging.INFO if args.verbose else logging.WARNING)
+
     if args.get_joints:
         get_joints(args.ip)
         return